@@ -9,46 +9,69 @@ Includes functionality for authenticating and fetching daily video performance m
 import datetime
 import logging
 
-from googleapiclient.discovery import build
-from utils.auth import get_credentials
+from utils.auth import ANALYTICS_SCOPES, get_credentials
 
 logger = logging.getLogger("yt_data_ingestion.analytics")
 
+ANALYTICS_REPORTS_URL = "https://youtubeanalytics.googleapis.com/v2/reports"
+METRICS = "views,estimatedMinutesWatched,averageViewDuration,subscribersGained"
 
-def get_analytics_service():
+
+def get_analytics_credentials():
     """
-    Build and return an authenticated YouTube Analytics API client.
+    Load (or refresh) the OAuth credentials used for the YouTube Analytics API.
 
     Returns:
-        googleapiclient.discovery.Resource: Authenticated analytics client.
+        google.auth.credentials.Credentials: Authenticated credentials.
     """
-    creds = get_credentials("token_analytics.pickle")
-    return build("youtubeAnalytics", "v2", credentials=creds)
+    return get_credentials("token_analytics.json", ANALYTICS_SCOPES)
 
 
-def fetch_video_stats(video_id):
+def analytics_date_range(days=90):
     """
-    Fetch daily video performance metrics for the past 90 days.
+    Return the ISO start and end dates of the report window ending today.
+
+    Compute this once per run and pass the strings to fetch_video_stats_async.
 
     Args:
+        days (int): Length of the window in days.
+
+    Returns:
+        tuple: (start_iso, end_iso) as "YYYY-MM-DD" strings.
+    """
+    end_date = datetime.date.today()
+    start_date = end_date - datetime.timedelta(days=days)
+    return start_date.isoformat(), end_date.isoformat()
+
+
+async def fetch_video_stats_async(session, video_id, creds, *, start_iso, end_iso):
+    """
+    Asynchronously fetch daily video performance metrics for a date range.
+
+    Queries the REST endpoint directly so that many videos can be requested
+    concurrently over a shared aiohttp session.
+
+    Args:
+        session (aiohttp.ClientSession): Open HTTP session to issue the request on.
         video_id (str): The ID of the YouTube video to retrieve data for.
+        creds: Valid OAuth credentials for the YouTube Analytics API.
+        start_iso (str): First day of the report window ("YYYY-MM-DD").
+        end_iso (str): Last day of the report window ("YYYY-MM-DD").
 
     Returns:
         dict: Raw response from the YouTube Analytics API.
     """
     logger.info(f"Fetching analytics for video ID: {video_id}")
-    analytics = get_analytics_service()
-    end_date = datetime.date.today()
-    start_date = end_date - datetime.timedelta(days=90)
-
-    response = analytics.reports().query(
-        ids="channel==MINE",
-        startDate=start_date.isoformat(),
-        endDate=end_date.isoformat(),
-        metrics="views,estimatedMinutesWatched,averageViewDuration,subscribersGained",
-        dimensions="day",
-        filters=f"video=={video_id}",
-        maxResults=100,
-    ).execute()
-
-    return response
+    params = {
+        "ids": "channel==MINE",
+        "startDate": start_iso,
+        "endDate": end_iso,
+        "metrics": METRICS,
+        "dimensions": "day",
+        "filters": f"video=={video_id}",
+        "maxResults": "100",
+    }
+    headers = {"Authorization": f"Bearer {creds.token}"}
+    async with session.get(ANALYTICS_REPORTS_URL, params=params, headers=headers) as response:
+        response.raise_for_status()
+        return await response.json()
@@ -11,6 +11,7 @@ New Features:
   - Both analytics and reporting commands support an --output option.
     For analytics, each video's result is saved to a file named with the base provided,
     the video id, and the current local timestamp (formatted as _YYYYMMDD_HHMMSS).
+  - Analytics for multiple videos are fetched concurrently (at most MAX_CONCURRENT_REQUESTS in flight).
   - The reporting command will either use an existing job (via --job-id) or, if not provided,
     search for or create a reporting job based on the report type.
   - The reporting command polls for available reports and downloads them.
@@ -19,21 +20,33 @@ New Features:
 Logging is enabled to provide insight into the program’s flow.
 """
 
+import asyncio
 import csv
-import json
 import logging
+import sys
 import time
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
 
+import aiohttp
+import orjson
 import typer
 
-from analytics.analytics_client import fetch_video_stats
+if sys.platform != "win32":
+    import uvloop
+
+from analytics.analytics_client import (
+    analytics_date_range,
+    fetch_video_stats_async,
+    get_analytics_credentials,
+)
 from reporting.reporting_client import (
+    get_reporting_credentials,
     get_reporting_service,
     create_reporting_job,
     list_reporting_jobs,
+    list_report_types_and_jobs,
     poll_and_download_reports,
     parse_csv,
 )
@@ -46,6 +59,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger("yt_data_ingestion")
 
+# Upper bound on concurrent YouTube Analytics requests.
+MAX_CONCURRENT_REQUESTS = 8
+
+# csv.writer's default line terminator, and the characters that make it quote a cell.
+_CSV_LINE_TERMINATOR = "\r\n"
+_CSV_SPECIAL_CHARS = ",\"\r\n"
+
 
 def load_video_ids(config_path: Path) -> list:
     """
@@ -59,45 +79,137 @@ def load_video_ids(config_path: Path) -> list:
         list: List of video IDs.
     """
     try:
-        with config_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict) and "video_ids" in data:
-                return data["video_ids"]
-            else:
-                logger.error("Invalid config format. Expecting a list or an object with a 'video_ids' key.")
-                raise ValueError("Invalid config format")
+        data = orjson.loads(config_path.read_bytes())
+        if type(data) is list:
+            return data
+        try:
+            return data["video_ids"]
+        except (KeyError, TypeError):
+            logger.error("Invalid config format. Expecting a list or an object with a 'video_ids' key.")
+            raise ValueError("Invalid config format") from None
     except Exception as e:
         logger.error(f"Error reading config file {config_path}: {e}")
         raise e
 
 
-def analytics_to_csv(response: dict, video_id: str) -> str:
+def _is_plain_csv_cell(cell) -> bool:
+    """
+    Return True if csv.writer would write the cell as str(cell), without quoting.
+    """
+    if isinstance(cell, str):
+        return not any(c in cell for c in _CSV_SPECIAL_CHARS)
+    return isinstance(cell, (int, float))
+
+
+def analytics_to_csv(response: dict, video_id: str, fp) -> None:
     """
-    Convert the YouTube Analytics API JSON response into CSV format.
+    Write the YouTube Analytics API JSON response to a file object in CSV format.
     Adds the video id as the first column for every row.
 
     This function expects the response to have "columnHeaders" and "rows" keys.
+    Rows made only of plain numbers and strings are joined directly; csv.writer is
+    only used for rows with cells that need quoting.
 
     Args:
         response (dict): The API response.
         video_id (str): The video id for which the data was fetched.
-
-    Returns:
-        str: CSV formatted string.
+        fp: Text file object to write to (opened with newline="" for real files).
     """
-    output = StringIO()
-    writer = csv.writer(output)
-    
+    writer = csv.writer(fp)
+
     # Extract headers from the response and prepend "video_id" as the first header.
-    headers = ["video_id"] + [header.get("name", "") for header in response.get("columnHeaders", [])]
+    headers = ["video_id", *(header["name"] for header in response["columnHeaders"])]
     writer.writerow(headers)
-    
+
     # Write rows, each prefixed with the video id.
+    prefix = f"{video_id},"
+    plain_video_id = _is_plain_csv_cell(video_id)
     for row in response.get("rows", []):
-        writer.writerow([video_id] + row)
-    return output.getvalue()
+        if plain_video_id and row and all(_is_plain_csv_cell(cell) for cell in row):
+            fp.write(prefix + ",".join(map(str, row)) + _CSV_LINE_TERMINATOR)
+        else:
+            writer.writerow([video_id] + row)
+
+
+def save_analytics(response: dict, vid: str, ext: str, output: str, timestamp: str):
+    """
+    Stream a single video's analytics response to a file, or echo it if no output is set.
+
+    JSON is serialized with orjson, which produces bytes that are written as-is.
+
+    Args:
+        response (dict): The API response.
+        vid (str): The video id for which the data was fetched.
+        ext (str): Output format ("json" or "csv").
+        output (str): Output filename base, or None to echo to stdout.
+        timestamp (str): Timestamp appended to the output filename.
+    """
+    if output:
+        filename = f"{output}_{vid}_{timestamp}.{ext}"
+        if ext == "csv":
+            with open(filename, "w", encoding="utf-8", newline="") as f:
+                analytics_to_csv(response, vid, f)
+        else:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(response, option=orjson.OPT_INDENT_2))
+        typer.echo(f"Analytics for video {vid} saved to {filename}\n")
+    else:
+        if ext == "csv":
+            buffer = StringIO()
+            analytics_to_csv(response, vid, buffer)
+            output_data = buffer.getvalue()
+        else:
+            output_data = orjson.dumps(response, option=orjson.OPT_INDENT_2).decode()
+        typer.echo(f"Analytics for video {vid}:\n{output_data}\n")
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion, on a uvloop event loop where uvloop is supported.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    if sys.platform != "win32":
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+async def fetch_and_save_analytics(video_ids: list, ext: str, output: str, timestamp: str):
+    """
+    Fetch analytics for all videos concurrently and save each result as it arrives.
+
+    A failure for one video is logged and does not affect the others.
+
+    Args:
+        video_ids (list): Video IDs to fetch analytics for.
+        ext (str): Output format ("json" or "csv").
+        output (str): Output filename base, or None to echo to stdout.
+        timestamp (str): Timestamp appended to the output filenames.
+    """
+    start_iso, end_iso = analytics_date_range()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async with aiohttp.ClientSession() as session:
+
+        async def bounded(vid):
+            async with semaphore:
+                logger.info(f"Fetching analytics for video: {vid}")
+                try:
+                    # Fetched per request (cached, cheap) so an expiring token is refreshed
+                    # before use; refresh is blocking, so it runs off the event loop.
+                    creds = await asyncio.to_thread(get_analytics_credentials)
+                    response = await fetch_video_stats_async(
+                        session, vid, creds, start_iso=start_iso, end_iso=end_iso
+                    )
+                    save_analytics(response, vid, ext, output, timestamp)
+                except Exception as e:
+                    logger.error(f"Error fetching analytics for video {vid}: {e}")
+
+        await asyncio.gather(*[bounded(vid) for vid in video_ids])
 
 
 @app.command()
@@ -143,24 +255,7 @@ def analytics(
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     ext = format.lower()
-
-    for vid in video_ids:
-        logger.info(f"Fetching analytics for video: {vid}")
-        try:
-            response = fetch_video_stats(vid)
-            if ext == "csv":
-                output_data = analytics_to_csv(response, vid)
-            else:
-                output_data = json.dumps(response, indent=4)
-            if output:
-                filename = f"{output}_{vid}_{timestamp}.{ext}"
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(output_data)
-                typer.echo(f"Analytics for video {vid} saved to {filename}\n")
-            else:
-                typer.echo(f"Analytics for video {vid}:\n{output_data}\n")
-        except Exception as e:
-            logger.error(f"Error fetching analytics for video {vid}: {e}")
+    run_async(fetch_and_save_analytics(video_ids, ext, output, timestamp))
 
 
 @app.command()
@@ -171,8 +266,14 @@ def reporting(
     format: str = typer.Option("csv", help="Output format", show_default=True),
     output: str = typer.Option(None, help="Output filename (no extension)"),
     max_poll_time: int = typer.Option(1200, help="Polling duration in seconds"),
-    start_date: str = typer.Option(None, help="Start date YYYY-MM-DD"),
-    end_date: str = typer.Option(None, help="End date YYYY-MM-DD"),
+    start_date: str = typer.Option(
+        None,
+        help="Start date YYYY-MM-DD; only reports starting on or after this day (UTC) are downloaded, "
+        "so the report for the day before is not included",
+    ),
+    end_date: str = typer.Option(
+        None, help="End date YYYY-MM-DD; only reports starting before this day (UTC) are downloaded"
+    ),
     list_only: bool = typer.Option(False, help="List available report types and jobs"),
 ):
     """
@@ -184,29 +285,28 @@ def reporting(
     If --job-id is not provided, the command will try to find an existing reporting job with the specified
     --report-type-id. If none is found, it will create a new one (or force creation if --force-new is specified).
 
-    The command then polls for available report files using the poll interval and max poll time specified.
+    The command then polls for available report files, starting with short waits that back off
+    exponentially (up to a minute), until reports are found or the max poll time is reached.
     
     When --output is provided, the output filename will have the current local date and time appended
     (formatted as _YYYYMMDD_HHMMSS) before the file extension.
     """
     if list_only:
         service = get_reporting_service()
+        report_types, jobs = list_report_types_and_jobs(service)
         typer.echo("Available Report Types:")
-        report_types = service.reportTypes().list().execute().get("reportTypes", [])
         for rt in report_types:
             typer.echo(f"ID: {rt.get('id')}, Name: {rt.get('name')}")
         typer.echo("\nExisting Reporting Jobs:")
-        for job in list_reporting_jobs(service):
+        for job in jobs:
             typer.echo(f"Job ID: {job.get('id')}, Name: {job.get('name')}, Type: {job.get('reportTypeId')}")
     else:
-        poll_interval = 60
-        max_attempts = max_poll_time // poll_interval
-
         # Process start_date and end_date if provided.
         s_date = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
         e_date = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
 
         service = get_reporting_service()
+        creds = get_reporting_credentials()
         used_job_id = None
 
         if job_id:
@@ -233,7 +333,7 @@ def reporting(
         logger.info(f"Using reporting job ID: {used_job_id}")
 
         # Poll and download report files.
-        reports = poll_and_download_reports(used_job_id, poll_interval, max_attempts, s_date, e_date)
+        reports = poll_and_download_reports(service, creds, used_job_id, max_poll_time, s_date, e_date)
 
         if not reports:
             typer.echo("No reports were downloaded.")
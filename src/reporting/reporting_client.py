@@ -6,29 +6,65 @@ Includes job creation, polling report availability, downloading CSV content,
 and parsing reports into structured data.
 """
 
+import asyncio
 import time
 import io
 import csv
+import functools
 import logging
-from datetime import datetime
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.auth.transport.requests import AuthorizedSession
-from utils.auth import get_credentials
+from requests.adapters import HTTPAdapter
+from utils.auth import REPORTING_SCOPES, get_credentials
 
 logger = logging.getLogger("yt_data_ingestion.reporting")
 
+# Number of report files downloaded in parallel.
+MAX_DOWNLOAD_WORKERS = 8
 
+# Page size requested when listing report files.
+REPORTS_PAGE_SIZE = 100
+
+# Backoff bounds (seconds) between polls for report files.
+POLL_BASE_INTERVAL = 5
+POLL_MAX_INTERVAL = 60
+
+# Shared HTTP sessions for report downloads, keyed by the credentials object they
+# authorize with and created on first use.
+_SESSIONS: dict = {}
+
+# Serializes use of the (non thread-safe) Reporting API client from worker threads.
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_reporting_credentials():
+    """
+    Load (or refresh) the OAuth credentials used for the YouTube Reporting API.
+
+    Returns:
+        google.auth.credentials.Credentials: Authenticated credentials.
+    """
+    return get_credentials("token_reporting.json", REPORTING_SCOPES)
+
+
+@functools.lru_cache(maxsize=1)
 def get_reporting_service():
     """
     Build and return an authenticated YouTube Reporting API client.
 
+    The client is built once per process and reused; the discovery document is loaded
+    from the copy bundled with google-api-python-client instead of being fetched.
+
     Returns:
         googleapiclient.discovery.Resource: Authenticated reporting service.
     """
-    creds = get_credentials("token_reporting.pickle")
-    return build("youtubereporting", "v1", credentials=creds)
+    creds = get_reporting_credentials()
+    return build("youtubereporting", "v1", credentials=creds, cache_discovery=False, static_discovery=True)
 
 
 def list_reporting_jobs(service):
@@ -44,6 +80,30 @@ def list_reporting_jobs(service):
     return service.jobs().list().execute().get("jobs", [])
 
 
+def list_report_types_and_jobs(service):
+    """
+    List available report types and existing reporting jobs in a single batch HTTP request.
+
+    Args:
+        service: YouTube Reporting API client.
+
+    Returns:
+        tuple: (report types, reporting jobs).
+    """
+    results = {}
+
+    def callback(request_id, response, exception):
+        if exception is not None:
+            raise exception
+        results[request_id] = response
+
+    batch = service.new_batch_http_request(callback=callback)
+    batch.add(service.reportTypes().list(), request_id="reportTypes")
+    batch.add(service.jobs().list(), request_id="jobs")
+    batch.execute()
+    return results["reportTypes"].get("reportTypes", []), results["jobs"].get("jobs", [])
+
+
 def create_reporting_job(service, report_type_id, name):
     """
     Create a new reporting job or retrieve an existing one for a given report type.
@@ -66,68 +126,208 @@ def create_reporting_job(service, report_type_id, name):
         raise e
 
 
-def list_report_files(service, job_id):
+def list_report_files(service, job_id, start_date=None, end_date=None, page_size=REPORTS_PAGE_SIZE):
     """
     List available report files for a given reporting job.
 
+    The date window is applied server-side (on each report's start time), and all
+    result pages are followed.
+
     Args:
         service: YouTube Reporting API client.
         job_id (str): Reporting job ID.
+        start_date (datetime, optional): Only list reports starting at or after this time (UTC).
+        end_date (datetime, optional): Only list reports starting before this time (UTC).
+        page_size (int, optional): Requested number of reports per page.
 
     Returns:
         list: Report metadata objects.
     """
-    return service.jobs().reports().list(jobId=job_id).execute().get("reports", [])
+    params = {"jobId": job_id, "pageSize": page_size}
+    if start_date:
+        params["startTimeAtOrAfter"] = start_date.isoformat() + "Z"
+    if end_date:
+        params["startTimeBefore"] = end_date.isoformat() + "Z"
+
+    reports = []
+    while True:
+        response = service.jobs().reports().list(**params).execute()
+        reports.extend(response.get("reports", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return reports
+        params["pageToken"] = page_token
+
+
+def get_authorized_session(creds):
+    """
+    Return the shared authorized session for the given credentials.
+
+    One session is created per credentials object and reused afterwards, so downloads
+    share one connection pool and keep-alive connections instead of opening a new TLS
+    connection per report. Callers with different credentials get different sessions.
+
+    Args:
+        creds: OAuth credentials the session authorizes requests with.
+
+    Returns:
+        AuthorizedSession: Shared authorized HTTP session.
+    """
+    session = _SESSIONS.get(creds)
+    if session is None:
+        session = AuthorizedSession(creds)
+        session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        session = _SESSIONS.setdefault(creds, session)
+    return session
 
 
-def download_report_file(download_url, creds):
+def download_report_file(download_url, session):
     """
     Download the report content using an authorized session.
 
     Args:
         download_url (str): URL to download the report file.
-        creds: OAuth credentials.
+        session (AuthorizedSession): Authorized HTTP session, safe to share across threads.
 
     Returns:
         str: CSV content of the report.
     """
-    session = AuthorizedSession(creds)
     response = session.get(download_url)
     response.raise_for_status()
     return response.text
 
 
-def poll_and_download_reports(job_id, poll_interval, max_attempts, start_date=None, end_date=None):
+def compute_backoff_delay(attempt, base_interval=POLL_BASE_INTERVAL, max_interval=POLL_MAX_INTERVAL):
+    """
+    Compute the wait before the next poll: exponential backoff, capped, plus up to 1s of jitter.
+
+    Args:
+        attempt (int): Number of polls already made without finding reports (0-based).
+        base_interval (float): Wait (seconds) after the first empty poll.
+        max_interval (float): Upper bound (seconds) on the backoff, before jitter.
+
+    Returns:
+        float: Seconds to wait.
+    """
+    return min(max_interval, base_interval * (2 ** attempt)) + random.uniform(0, 1)
+
+
+def _poll_delays(max_poll_time, base_interval, max_interval):
+    """
+    Yield the wait (seconds) before each poll: 0 for the first, then backoff delays.
+
+    Stops once the next wait would end more than max_poll_time after the first poll.
+    """
+    deadline = time.monotonic() + max_poll_time
+    yield 0
+    attempt = 0
+    while True:
+        delay = compute_backoff_delay(attempt, base_interval, max_interval)
+        if time.monotonic() + delay > deadline:
+            return
+        yield delay
+        attempt += 1
+
+
+def _fetch_available_reports(service, session, job_id, start_date, end_date):
+    """
+    List the job's report files in the date window and download them in parallel.
+
+    The Reporting API client is not thread-safe, so listing is serialized when
+    several jobs are polled concurrently; downloads use the shared session.
+
+    Returns:
+        list: List of CSV content strings (empty if no reports are available yet).
+    """
+    with _SERVICE_LOCK:
+        reports = list_report_files(service, job_id, start_date, end_date)
+    urls = [report["downloadUrl"] for report in reports]
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        return list(executor.map(lambda url: download_report_file(url, session), urls))
+
+
+def poll_and_download_reports(
+    service,
+    creds,
+    job_id,
+    max_poll_time,
+    start_date=None,
+    end_date=None,
+    base_interval=POLL_BASE_INTERVAL,
+    max_interval=POLL_MAX_INTERVAL,
+):
     """
     Poll for available report files over time and download those within a specified date range.
 
+    Polls start frequently and back off exponentially (with jitter) up to max_interval,
+    until reports are found or max_poll_time would be exceeded. All matching report
+    files from a poll are downloaded in parallel.
+
     Args:
+        service: YouTube Reporting API client.
+        creds: OAuth credentials for the Reporting API.
+        job_id (str): Reporting job ID.
+        max_poll_time (int): Maximum total time (seconds) to keep polling.
+        start_date (datetime, optional): Filter start date.
+        end_date (datetime, optional): Filter end date.
+        base_interval (float): Wait (seconds) after the first empty poll.
+        max_interval (float): Upper bound (seconds) on the wait between polls.
+
+    Returns:
+        list: List of CSV content strings.
+    """
+    session = get_authorized_session(creds)
+    for delay in _poll_delays(max_poll_time, base_interval, max_interval):
+        if delay:
+            logger.info(f"No report files yet for job {job_id}. Polling again in {delay:.0f} seconds...")
+            time.sleep(delay)
+        downloaded = _fetch_available_reports(service, session, job_id, start_date, end_date)
+        if downloaded:
+            return downloaded
+    return []
+
+
+async def poll_and_download_reports_async(
+    service,
+    creds,
+    job_id,
+    max_poll_time,
+    start_date=None,
+    end_date=None,
+    base_interval=POLL_BASE_INTERVAL,
+    max_interval=POLL_MAX_INTERVAL,
+):
+    """
+    Async variant of poll_and_download_reports, so several jobs can be polled concurrently.
+
+    The blocking API calls run in worker threads and waits use asyncio.sleep.
+
+    Args:
+        service: YouTube Reporting API client.
+        creds: OAuth credentials for the Reporting API.
         job_id (str): Reporting job ID.
-        poll_interval (int): Time (seconds) between poll attempts.
-        max_attempts (int): Maximum number of attempts.
+        max_poll_time (int): Maximum total time (seconds) to keep polling.
         start_date (datetime, optional): Filter start date.
         end_date (datetime, optional): Filter end date.
+        base_interval (float): Wait (seconds) after the first empty poll.
+        max_interval (float): Upper bound (seconds) on the wait between polls.
 
     Returns:
         list: List of CSV content strings.
     """
-    service = get_reporting_service()
-    creds = get_credentials("token_reporting.pickle")
-    downloaded = []
-
-    for _ in range(max_attempts):
-        reports = list_report_files(service, job_id)
-        for report in reports:
-            end_time_ms = int(report.get("endTimeMs", 0))
-            report_date = datetime.utcfromtimestamp(end_time_ms / 1000)
-            if (not start_date or report_date >= start_date) and (not end_date or report_date <= end_date):
-                content = download_report_file(report["downloadUrl"], creds)
-                downloaded.append(content)
+    session = get_authorized_session(creds)
+    for delay in _poll_delays(max_poll_time, base_interval, max_interval):
+        if delay:
+            logger.info(f"No report files yet for job {job_id}. Polling again in {delay:.0f} seconds...")
+            await asyncio.sleep(delay)
+        downloaded = await asyncio.to_thread(
+            _fetch_available_reports, service, session, job_id, start_date, end_date
+        )
         if downloaded:
-            break
-        logger.info("No report files yet. Waiting for the next poll interval...")
-        time.sleep(poll_interval)
-    return downloaded
+            return downloaded
+    return []
 
 
 def parse_csv(content):
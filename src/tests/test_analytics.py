@@ -1,10 +1,15 @@
+import asyncio
+import csv
 import json
 import tempfile
+from io import StringIO
 from pathlib import Path
+from types import SimpleNamespace
 import pytest
 
 # Import the helper function from main.py to load video IDs from a config file.
-from main import load_video_ids
+from main import analytics_to_csv, load_video_ids
+from analytics.analytics_client import ANALYTICS_REPORTS_URL, fetch_video_stats_async
 
 def test_load_video_ids_list_format():
     """Test loading a config file that is a simple JSON list."""
@@ -35,3 +40,67 @@ def test_load_video_ids_invalid_format():
         path = Path(tmp.name)
         with pytest.raises(ValueError):
             load_video_ids(path)
+
+class FakeResponse:
+    """Stand-in for an aiohttp response used as an async context manager."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return {"rows": []}
+
+
+class FakeSession:
+    """Stand-in for aiohttp.ClientSession that records each GET request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params=None, headers=None):
+        self.requests.append((url, params, headers))
+        return FakeResponse()
+
+
+def test_fetch_video_stats_async_request_params():
+    """Test that a single-video, day-dimension query is sent with the caller's bearer token."""
+    session = FakeSession()
+    creds = SimpleNamespace(token="abc")
+    response = asyncio.run(
+        fetch_video_stats_async(session, "vid1", creds, start_iso="2024-01-01", end_iso="2024-03-31")
+    )
+    assert response == {"rows": []}
+    assert session.requests == [(
+        ANALYTICS_REPORTS_URL,
+        {
+            "ids": "channel==MINE",
+            "startDate": "2024-01-01",
+            "endDate": "2024-03-31",
+            "metrics": "views,estimatedMinutesWatched,averageViewDuration,subscribersGained",
+            "dimensions": "day",
+            "filters": "video==vid1",
+            "maxResults": "100",
+        },
+        {"Authorization": "Bearer abc"},
+    )]
+
+def test_analytics_to_csv_matches_csv_writer():
+    """Test that the CSV fast path produces the same output as csv.writer, including quoted cells."""
+    response = {
+        "columnHeaders": [{"name": "day"}, {"name": "views"}, {"name": "averageViewDuration"}],
+        "rows": [["2024-01-01", 10, 1.5], ["2024-01-02", "a,b", 'say "hi"']],
+    }
+    expected = StringIO()
+    writer = csv.writer(expected)
+    writer.writerow(["video_id", "day", "views", "averageViewDuration"])
+    for row in response["rows"]:
+        writer.writerow(["vid"] + row)
+    actual = StringIO()
+    analytics_to_csv(response, "vid", actual)
+    assert actual.getvalue() == expected.getvalue()
@@ -0,0 +1,42 @@
+import pytest
+
+from utils import auth
+
+
+class FakeCredentials:
+    """Minimal stand-in for the credentials returned by the OAuth flow."""
+
+    valid = True
+
+    def has_scopes(self, scopes):
+        return True
+
+    def to_json(self):
+        return '{"token": "fresh"}'
+
+
+class FakeFlow:
+    def run_local_server(self, port):
+        return FakeCredentials()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"token": "t", "client_id": "id", "client_secret": "secret"}',  # no refresh_token
+        '{"token": "t", "client_',  # truncated
+    ],
+)
+def test_get_credentials_reruns_flow_for_unreadable_token_file(tmp_path, monkeypatch, content):
+    """Test that a token file that cannot be loaded is ignored and replaced via the OAuth flow."""
+    token_file = tmp_path / "token.json"
+    token_file.write_text(content, encoding="utf-8")
+    monkeypatch.setattr(auth, "_CREDS_CACHE", {})
+    monkeypatch.setattr(
+        auth.InstalledAppFlow, "from_client_secrets_file", lambda *args, **kwargs: FakeFlow()
+    )
+
+    creds = auth.get_credentials(str(token_file), auth.ANALYTICS_SCOPES)
+
+    assert isinstance(creds, FakeCredentials)
+    assert token_file.read_text(encoding="utf-8") == '{"token": "fresh"}'
@@ -1,3 +1,121 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from reporting import reporting_client
+from reporting.reporting_client import (
+    compute_backoff_delay,
+    get_authorized_session,
+    list_report_files,
+    poll_and_download_reports,
+    poll_and_download_reports_async,
+)
+
 def test_reporting_placeholder():
     # Placeholder test – reporting functions typically require integration testing.
     assert True
+
+def test_compute_backoff_delay_grows_and_caps():
+    """Test that the poll delay doubles per attempt, is capped, and adds at most 1s of jitter."""
+    for attempt, expected in [(0, 5), (1, 10), (2, 20), (3, 40), (4, 60), (10, 60)]:
+        delay = compute_backoff_delay(attempt, base_interval=5, max_interval=60)
+        assert expected <= delay <= expected + 1
+
+
+@pytest.fixture
+def fake_poll(monkeypatch):
+    """Run polling on a fake clock, without jitter, with a scripted list of poll results."""
+    clock = {"now": 0.0}
+    sleeps = []
+    results = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        clock["now"] += delay
+
+    async def async_sleep(delay):
+        sleep(delay)
+
+    monkeypatch.setattr(reporting_client.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(reporting_client.time, "sleep", sleep)
+    monkeypatch.setattr(reporting_client.asyncio, "sleep", async_sleep)
+    monkeypatch.setattr(reporting_client.random, "uniform", lambda a, b: 0)
+    monkeypatch.setattr(reporting_client, "get_authorized_session", lambda creds: "session")
+    monkeypatch.setattr(
+        reporting_client, "_fetch_available_reports", lambda *args: results.pop(0) if results else []
+    )
+    return sleeps, results
+
+
+def test_poll_backs_off_until_reports_are_available(fake_poll):
+    """Test that polling backs off between empty polls and returns the first non-empty result."""
+    sleeps, results = fake_poll
+    results.extend([[], [], ["report"]])
+    assert poll_and_download_reports("service", "creds", "job", max_poll_time=600) == ["report"]
+    assert sleeps == [5, 10]
+
+
+def test_poll_stops_before_exceeding_max_poll_time(fake_poll):
+    """Test that polling gives up when the next wait would pass max_poll_time."""
+    sleeps, _ = fake_poll
+    assert poll_and_download_reports("service", "creds", "job", max_poll_time=40) == []
+    assert sleeps == [5, 10, 20]
+
+
+def test_poll_async_uses_the_same_schedule(fake_poll):
+    """Test that the async variant follows the same backoff and deadline."""
+    sleeps, results = fake_poll
+    results.extend([[], ["report"]])
+    assert asyncio.run(poll_and_download_reports_async("service", "creds", "job", max_poll_time=600)) == ["report"]
+    assert sleeps == [5]
+    sleeps.clear()
+    assert asyncio.run(poll_and_download_reports_async("service", "creds", "job", max_poll_time=40)) == []
+    assert sleeps == [5, 10, 20]
+
+
+class FakeReportsList:
+    """Stand-in for service.jobs().reports() that serves scripted pages and records requests."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def list(self, **params):
+        self.calls.append(dict(params))
+        page = self.pages[len(self.calls) - 1]
+        return SimpleNamespace(execute=lambda: page)
+
+
+def test_list_report_files_filters_server_side_and_follows_pages():
+    """Test that the date window is sent as RFC 3339 UTC filters and every page is read."""
+    reports = FakeReportsList([
+        {"reports": [{"id": "1"}], "nextPageToken": "p2"},
+        {"reports": [{"id": "2"}]},
+    ])
+    service = SimpleNamespace(jobs=lambda: SimpleNamespace(reports=lambda: reports))
+
+    listed = list_report_files(service, "job", datetime(2024, 1, 1), datetime(2024, 2, 1))
+
+    assert listed == [{"id": "1"}, {"id": "2"}]
+    expected = {
+        "jobId": "job",
+        "pageSize": 100,
+        "startTimeAtOrAfter": "2024-01-01T00:00:00Z",
+        "startTimeBefore": "2024-02-01T00:00:00Z",
+    }
+    assert reports.calls == [expected, {**expected, "pageToken": "p2"}]
+
+
+def test_get_authorized_session_is_shared_per_credentials(monkeypatch):
+    """Test that the download session is reused for the same credentials only."""
+    monkeypatch.setattr(reporting_client, "_SESSIONS", {})
+    creds_a, creds_b = Credentials("a"), Credentials("b")
+
+    session_a = get_authorized_session(creds_a)
+
+    assert get_authorized_session(creds_a) is session_a
+    assert get_authorized_session(creds_b) is not session_a
+    assert get_authorized_session(creds_b).credentials is creds_b
@@ -3,52 +3,90 @@ auth.py
 
 Provides shared authentication utilities for accessing Google APIs (YouTube Analytics & Reporting).
 Handles OAuth2 token loading, refreshing, and persistence.
+Loaded credentials are cached in memory per token file, so repeated calls are cheap.
 
-Scopes are limited to read-only access for YouTube Analytics.
+Each service requests its own minimal read-only scopes, and a stored token is only
+reused if it was granted the scopes the caller asks for.
 
 Expected:
 - A valid `client_secret.json` file in the root directory.
-- Token files are persisted separately for analytics and reporting services.
+- Token files are persisted separately for analytics and reporting services, as the
+  authorized-user JSON produced by Credentials.to_json().
 """
 
+import json
+import logging
 import os
-import pickle
+import threading
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 
-# Define the read-only scope for YouTube Analytics API
-SCOPES = ["https://www.googleapis.com/auth/yt-analytics.readonly"]
+logger = logging.getLogger("yt_data_ingestion.auth")
 
-def get_credentials(token_file):
+# Read-only scopes for each API. The Reporting API has no scope of its own; it
+# accepts the YouTube Analytics read-only scope.
+ANALYTICS_SCOPES = ["https://www.googleapis.com/auth/yt-analytics.readonly"]
+REPORTING_SCOPES = ["https://www.googleapis.com/auth/yt-analytics.readonly"]
+
+# In-memory credentials keyed by token file, guarded by a lock so concurrent
+# callers do not refresh or run the OAuth flow twice.
+_CREDS_CACHE = {}
+_CREDS_LOCK = threading.Lock()
+
+def get_credentials(token_file, scopes):
     """
     Retrieve or refresh credentials from the specified token file.
 
+    Valid credentials already loaded for the token file are returned from memory.
+    A stored token that cannot be parsed, or was not granted all of the requested scopes,
+    is discarded.
     If no valid token is found, initiates the OAuth flow to authorize access.
 
     Args:
-        token_file (str): Filename to load/save credentials (e.g., 'token_analytics.pickle').
+        token_file (str): Filename to load/save credentials (e.g., 'token_analytics.json').
+        scopes (list): OAuth scopes the credentials must have.
 
     Returns:
         google.auth.credentials.Credentials: Authenticated credentials.
     """
-    creds = None
-
-    # Attempt to load existing credentials.
-    if os.path.exists(token_file):
-        with open(token_file, "rb") as token:
-            creds = pickle.load(token)
-
-    # Refresh or generate new credentials if necessary.
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            # Initiate browser-based OAuth flow using the client secrets file.
-            flow = InstalledAppFlow.from_client_secrets_file("client_secret.json", SCOPES)
-            creds = flow.run_local_server(port=0)
-
-        # Save credentials for future use.
-        with open(token_file, "wb") as token:
-            pickle.dump(creds, token)
+    creds = _CREDS_CACHE.get(token_file)
+    if creds and creds.valid and creds.has_scopes(scopes):
+        return creds
+
+    with _CREDS_LOCK:
+        # Another thread may have loaded or refreshed the credentials meanwhile.
+        creds = _CREDS_CACHE.get(token_file)
+        if creds and not creds.has_scopes(scopes):
+            creds = None
+        if creds and creds.valid:
+            return creds
+
+        # Attempt to load existing credentials, keeping them only if they cover the scopes.
+        if not creds and os.path.exists(token_file):
+            try:
+                with open(token_file, "r", encoding="utf-8") as token:
+                    creds = Credentials.from_authorized_user_info(json.load(token))
+            except ValueError as e:
+                # Corrupt or incomplete (e.g. no refresh_token) files are treated as missing.
+                logger.warning(f"Ignoring unreadable token file {token_file}: {e}")
+                creds = None
+            if creds and not creds.has_scopes(scopes):
+                creds = None
+
+        # Refresh or generate new credentials if necessary.
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                # Initiate browser-based OAuth flow using the client secrets file.
+                flow = InstalledAppFlow.from_client_secrets_file("client_secret.json", scopes)
+                creds = flow.run_local_server(port=0)
+
+            # Save credentials for future use.
+            with open(token_file, "w", encoding="utf-8") as token:
+                token.write(creds.to_json())
+
+        _CREDS_CACHE[token_file] = creds
 
     return creds